@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from husqvarna_automower_ble.mower import Mower
 from husqvarna_automower_ble.protocol import ResponseResult
 from bleak import BleakError
+from bleak.backends.device import BLEDevice
 from bleak_retry_connector import close_stale_connections_by_address, get_device
 
 from homeassistant.components import bluetooth
@@ -16,7 +18,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import DOMAIN, CONF_ADDRESS, CONF_PIN, CONF_CLIENT_ID, STARTUP_MESSAGE
-from .coordinator import HusqvarnaCoordinator
+from .coordinator import BLE_RADIO_LOCK, HusqvarnaCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,34 +27,78 @@ PLATFORMS: list[Platform] = [
     Platform.SENSOR,
 ]
 
+# Last resolved BLEDevice per address, so ConfigEntryNotReady retries don't
+# fall back to a full scan when HA's advertisement cache is cold.
+_DEVICE_CACHE: dict[str, BLEDevice] = {}
+
+# How long to wait for HA's scanner to see an advertisement before falling
+# back to a fresh BlueZ discovery pass.
+_ADVERTISEMENT_TIMEOUT = 3.0
+
+
+async def _resolve_device(hass: HomeAssistant, address: str) -> BLEDevice | None:
+    """Resolve a BLEDevice for the address, reusing the last known device."""
+    device = bluetooth.async_ble_device_from_address(hass, address, connectable=True)
+    if not device:
+        device = _DEVICE_CACHE.get(address)
+    if not device:
+        # Give HA's already-running scanner a short window to catch an
+        # advertisement before spinning up a separate BlueZ discovery.
+        # HA filters on the matcher's address case-sensitively before the
+        # callback runs, so normalize to the uppercase form BlueZ reports.
+        address_upper = address.upper()
+        try:
+            await bluetooth.async_process_advertisements(
+                hass,
+                lambda service_info: service_info.address.upper() == address_upper,
+                {"address": address_upper},
+                bluetooth.BluetoothScanningMode.ACTIVE,
+                _ADVERTISEMENT_TIMEOUT,
+            )
+            device = bluetooth.async_ble_device_from_address(
+                hass, address, connectable=True
+            )
+        except TimeoutError:
+            device = None
+    if not device:
+        device = await get_device(address)
+    if device:
+        _DEVICE_CACHE[address] = device
+    return device
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Husqvarna Autoconnect Bluetooth from a config entry."""
-    address: str = entry.data[CONF_ADDRESS]
-    pin: int | None = entry.data.get(CONF_PIN)
-    channel_id: int = entry.data[CONF_CLIENT_ID]
+    data = entry.data
+    address: str = data[CONF_ADDRESS]
+    pin: int | None = data.get(CONF_PIN)
+    channel_id: int = data[CONF_CLIENT_ID]
 
     _LOGGER.info(STARTUP_MESSAGE)
 
     mower = Mower(channel_id, address, pin)
 
-    await close_stale_connections_by_address(address)
+    # Fire the BlueZ cleanup in the background; the connect attempt below
+    # re-closes stale connections if needed, so setup need not wait for it.
+    hass.async_create_task(close_stale_connections_by_address(address))
 
     _LOGGER.debug(
         "Connecting to %s with channel ID %s and pin %s", address, channel_id, pin
     )
 
     try:
-        # Attempt to find and connect to the device
-        device = bluetooth.async_ble_device_from_address(
-            hass, address, connectable=True
-        ) or await get_device(address)
-
-        if not device:
-            _LOGGER.error("No BLE device found at %s", address)
-            raise ConfigEntryNotReady(f"No BLE device found at {address}")
-
-        response_result = await mower.connect(device)
+        # Entries set up in parallel share the radio with running polls;
+        # serialize the scan/connect critical section through the same lock
+        # the coordinators use.
+        async with BLE_RADIO_LOCK:
+            # Attempt to find and connect to the device
+            device = await _resolve_device(hass, address)
+
+            if not device:
+                _LOGGER.error("No BLE device found at %s", address)
+                raise ConfigEntryNotReady(f"No BLE device found at {address}")
+
+            response_result = await mower.connect(device)
         if response_result != ResponseResult.OK:
             raise ConfigEntryNotReady(
                 f"Unable to connect to device {address}, mower returned {response_result}"
@@ -63,14 +109,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     _LOGGER.debug("Connected and paired successfully")
 
-    # Retrieve mower details
+    # Retrieve mower details sequentially under the radio lock; the library
+    # runs one request/response exchange at a time, and sequential awaits
+    # ensure no read survives into the error path below.
     try:
-        manufacturer = await mower.get_manufacturer()
-        model = await mower.get_model()
-        serial = await mower.get_serial_number()
+        async with BLE_RADIO_LOCK:
+            manufacturer = await mower.get_manufacturer()
+            model = await mower.get_model()
+            serial = await mower.get_serial_number()
         _LOGGER.info("Connected to Automower: %s (Serial: %s)", model, serial)
     except Exception as ex:
         _LOGGER.exception("Failed to retrieve mower details: %s", ex)
+        # Don't leak the open link across the ConfigEntryNotReady retry
+        if mower.is_connected():
+            await mower.disconnect()
         raise ConfigEntryNotReady(f"Failed to retrieve mower details: {ex}") from ex
 
     # Set up the coordinator
@@ -78,15 +130,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass, mower, address, manufacturer, model, channel_id, serial
     )
 
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as ex:
-        _LOGGER.exception("Failed to refresh coordinator data: %s", ex)
-        raise ConfigEntryNotReady(f"Failed to initialize coordinator: {ex}") from ex
-
-    # Store the coordinator and forward entry setups
+    # Store the coordinator, then overlap the first refresh with platform
+    # setup; the entities tolerate coordinator.data being None until the
+    # refresh lands.
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # return_exceptions=True lets both finish before any cleanup runs, so a
+    # refresh failure never unloads platforms mid-forward or orphans the
+    # forwarding coroutine.
+    refresh_result, forward_result = await asyncio.gather(
+        coordinator.async_config_entry_first_refresh(),
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        return_exceptions=True,
+    )
+    for result in (refresh_result, forward_result):
+        if isinstance(result, BaseException):
+            _LOGGER.error("Failed to initialize coordinator: %s", result)
+            await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+            hass.data[DOMAIN].pop(entry.entry_id, None)
+            # Don't leak the open link across the ConfigEntryNotReady retry
+            if mower.is_connected():
+                await mower.disconnect()
+            raise ConfigEntryNotReady(
+                f"Failed to initialize coordinator: {result}"
+            ) from result
 
     return True
 
@@ -95,6 +162,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator: HusqvarnaCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        _DEVICE_CACHE.pop(coordinator.address, None)
         await coordinator.async_shutdown()
 
     return unload_ok
@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 import logging
-import random
-import re
-from typing import Any
+import secrets
+from typing import Any, Final
 
 from bleak_retry_connector import get_device
 from husqvarna_automower_ble.mower import Mower
@@ -21,16 +20,32 @@ from .const import DOMAIN, CONF_ADDRESS, CONF_PIN, CONF_CLIENT_ID
 
 _LOGGER = logging.getLogger(__name__)
 
+HUSQVARNA_MANUFACTURER_ID: Final = 1062
+HUSQVARNA_SERVICE_UUID: Final = "98bd0001-0b0e-421a-84e5-ddbf75dc6de4"
+
 
 def _is_valid_bluetooth_address(address: str) -> bool:
-    """Validate if the provided string is a valid Bluetooth address format."""
-    if not address:
+    """Validate if the provided string is a valid Bluetooth address format.
+
+    Bluetooth addresses are 6 groups of 2 hex digits separated by colons
+    (or dashes), e.g. XX:XX:XX:XX:XX:XX, case insensitive.
+    """
+    if len(address) != 17:
+        return False
+    sep = address[2]
+    if sep not in ":-":
         return False
+    try:
+        # str.replace and bytes.fromhex validate the hex pairs in C;
+        # fromhex rejects stray separators and odd-length input
+        return len(bytes.fromhex(address.replace(sep, ""))) == 6
+    except ValueError:
+        return False
+
 
-    # Bluetooth addresses are 6 groups of 2 hex digits separated by colons
-    # Format: XX:XX:XX:XX:XX:XX (case insensitive)
-    bluetooth_pattern = r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$"
-    return bool(re.match(bluetooth_pattern, address))
+def _create_mower(channel_id: int, address: str, pin: int | None) -> Mower:
+    """Construct a Mower off the event loop; __init__ may do blocking work."""
+    return Mower(channel_id, address, pin)
 
 
 def _is_supported(discovery_info: BluetoothServiceInfo) -> bool:
@@ -42,13 +57,11 @@ def _is_supported(discovery_info: BluetoothServiceInfo) -> bool:
         discovery_info.manufacturer_data,
     )
 
-    manufacturer = any(key == 1062 for key in discovery_info.manufacturer_data)
-    service_husqvarna = any(
-        service == "98bd0001-0b0e-421a-84e5-ddbf75dc6de4"
-        for service in discovery_info.service_uuids
-    )
-
-    return manufacturer and service_husqvarna
+    # Check the manufacturer first; it is a dict lookup and rejects the
+    # overwhelming majority of advertisements without touching the UUID list.
+    if HUSQVARNA_MANUFACTURER_ID not in discovery_info.manufacturer_data:
+        return False
+    return HUSQVARNA_SERVICE_UUID in discovery_info.service_uuids
 
 
 class HusqvarnaAutomowerBleConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -56,10 +69,15 @@ class HusqvarnaAutomowerBleConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    # The parent ConfigFlow keeps a __dict__, so this only speeds up access
+    # to our own attributes during discovery bursts rather than dropping it.
+    __slots__ = ("address", "pin", "_discovered_address")
+
     def __init__(self) -> None:
         """Initialize the config flow."""
         self.address: str = ""
         self.pin: int | None = None
+        self._discovered_address: str | None = None
         _LOGGER.debug("Initializing Husqvarna Bluetooth config flow")
 
     async def async_step_bluetooth(
@@ -74,6 +92,7 @@ class HusqvarnaAutomowerBleConfigFlow(ConfigFlow, domain=DOMAIN):
         self.address = discovery_info.address
         await self.async_set_unique_id(self.address)
         self._abort_if_unique_id_configured()
+        self._discovered_address = self.address
         return await self.async_step_user()
 
     async def async_step_user(
@@ -100,8 +119,11 @@ class HusqvarnaAutomowerBleConfigFlow(ConfigFlow, domain=DOMAIN):
             errors["base"] = "invalid_pin_format"
             return self._show_user_form(errors)
 
-        await self.async_set_unique_id(self.address, raise_on_progress=False)
-        self._abort_if_unique_id_configured()
+        # The discovery step already set and checked the unique ID; only
+        # repeat the O(entries) scan if the user typed a different address.
+        if self.address != self._discovered_address:
+            await self.async_set_unique_id(self.address, raise_on_progress=False)
+            self._abort_if_unique_id_configured()
 
         try:
             device = bluetooth.async_ble_device_from_address(
@@ -113,8 +135,10 @@ class HusqvarnaAutomowerBleConfigFlow(ConfigFlow, domain=DOMAIN):
                 errors["base"] = "device_not_found"
                 return self._show_user_form(errors)
 
-            channel_id = random.randint(1, 0xFFFFFFFF)
-            mower = Mower(channel_id, self.address, self.pin)
+            channel_id = secrets.randbits(32) or 1
+            mower = await self.hass.async_add_executor_job(
+                _create_mower, channel_id, self.address, self.pin
+            )
 
             # Probe the device
             manufacture, device_type, model = await mower.probe_gatts(device)
@@ -142,7 +166,9 @@ class HusqvarnaAutomowerBleConfigFlow(ConfigFlow, domain=DOMAIN):
             _LOGGER.debug("Successfully probed and connected to %s", self.address)
 
             # Create the configuration entry
-            title = f"{manufacture} {device_type.replace(chr(0), '')}"
+            # GATT reads pad fixed-size strings with trailing NULs
+            device_type = device_type.rstrip("\x00")
+            title = f"{manufacture} {device_type}"
             _LOGGER.info("Creating configuration entry with title: %s", title)
             return self.async_create_entry(
                 title=title,
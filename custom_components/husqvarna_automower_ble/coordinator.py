@@ -2,21 +2,33 @@
 
 from __future__ import annotations
 import asyncio
+from collections.abc import Callable
 from datetime import datetime, timedelta
 import logging
+from time import monotonic
 from typing import Any
 
 from bleak_retry_connector import get_device
+from husqvarna_automower_ble.error_codes import ErrorCodes
 from husqvarna_automower_ble.mower import Mower
-from husqvarna_automower_ble.protocol import ResponseResult
+from husqvarna_automower_ble.protocol import (
+    ModeOfOperation,
+    MowerActivity,
+    MowerState,
+    ResponseResult,
+)
 from bleak import BleakError
+from bleak.backends.device import BLEDevice
 
 from homeassistant.components import bluetooth
+from homeassistant.components.lawn_mower import LawnMowerActivity
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo, format_mac
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 
@@ -24,10 +36,141 @@ _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=60)
 
+# Drop the connection after this many failed polls so the next cycle starts
+# from a clean reconnect instead of reusing a wedged link.
+MAX_CONSECUTIVE_FAILURES = 3
+
+# Reuse a resolved BLEDevice for this long before looking it up again, so a
+# user command landing near a scheduled poll doesn't trigger a second scan.
+DEVICE_CACHE_TTL = 30.0
+
+# All configured mowers share one radio, which cannot service two
+# scan/connect/poll sweeps at once. Module level so every coordinator (one
+# per config entry) and entry setup serializes through the same lock instead
+# of colliding on the adapter.
+BLE_RADIO_LOCK = asyncio.Lock()
+
+# Mower state alone decides these; STOPPED/OFF/WAIT_FOR_SAFETYPIN are
+# actually stopped, but that isn't an option in LawnMowerActivity.
+_STATE_OVERRIDE = {
+    MowerState.PAUSED: LawnMowerActivity.PAUSED,
+    MowerState.STOPPED: LawnMowerActivity.ERROR,
+    MowerState.OFF: LawnMowerActivity.ERROR,
+    MowerState.WAIT_FOR_SAFETYPIN: LawnMowerActivity.ERROR,
+}
+
+# For operational states the mower activity picks the HA activity.
+_ACTIVITY_MAP = {}
+for _state in (MowerState.RESTRICTED, MowerState.IN_OPERATION, MowerState.PENDING_START):
+    for _activity in (MowerActivity.CHARGING, MowerActivity.PARKED, MowerActivity.NONE):
+        _ACTIVITY_MAP[(_state, _activity)] = LawnMowerActivity.DOCKED
+    for _activity in (MowerActivity.GOING_OUT, MowerActivity.MOWING):
+        _ACTIVITY_MAP[(_state, _activity)] = LawnMowerActivity.MOWING
+    _ACTIVITY_MAP[(_state, MowerActivity.GOING_HOME)] = LawnMowerActivity.RETURNING
+del _state, _activity
+
+
+def _derive_activity(
+    state: MowerState | None, activity: MowerActivity | None
+) -> LawnMowerActivity | None:
+    """Map raw mower state and activity to a LawnMowerActivity."""
+    if state is None or activity is None:
+        return None
+    return _STATE_OVERRIDE.get(state) or _ACTIVITY_MAP.get(
+        (state, activity), LawnMowerActivity.ERROR
+    )
+
+
+def _normalize_next_start_time(value: Any) -> datetime | None:
+    """Return a timezone-aware datetime for the timestamp sensor.
+
+    The sensor uses SensorDeviceClass.TIMESTAMP, so HA serializes the
+    datetime once at the API boundary instead of this integration
+    formatting a string per poll.
+    """
+    if not isinstance(value, datetime):
+        _LOGGER.warning("Expected datetime for next_start_time, got %s", type(value))
+        return None
+    if value.tzinfo is None:
+        # The mower reports local time
+        return value.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return value
+
+
+def _build_name_lookup(enum_cls) -> Callable[[Any], Any]:
+    """Build a value-to-name lookup for an enum, resolved once at import.
+
+    Accepts both enum members and raw values, matching the baseline
+    ``Enum(value).name`` semantics. Dense small-int enums get a list-indexed
+    table (faster than a dict in CPython); sparse ones fall back to a dict.
+    Unknown values pass through.
+    """
+    values = [member.value for member in enum_cls]
+    if all(isinstance(value, int) and value >= 0 for value in values) and max(
+        values
+    ) < 2 * len(values):
+        table: list[str | None] = [None] * (max(values) + 1)
+        for member in enum_cls:
+            table[member.value] = member.name
+
+        def lookup(value: Any, _enum_cls=enum_cls, _table=table) -> Any:
+            if isinstance(value, _enum_cls):
+                return value.name
+            if isinstance(value, int) and 0 <= value < len(_table):
+                name = _table[value]
+                if name is not None:
+                    return name
+            return value
+
+        return lookup
+
+    mapping = {member.value: member.name for member in enum_cls}
+
+    def lookup(value: Any, _enum_cls=enum_cls, _mapping=mapping) -> Any:
+        if isinstance(value, _enum_cls):
+            return value.name
+        return _mapping.get(value, value)
+
+    return lookup
+
+
+_KEY_TRANSFORMERS: dict[str, Callable[[Any], Any]] = {
+    "mode": _build_name_lookup(ModeOfOperation),
+    "state": _build_name_lookup(MowerState),
+    "activity": _build_name_lookup(MowerActivity),
+    "error": _build_name_lookup(ErrorCodes),
+    "next_start_time": _normalize_next_start_time,
+}
+
+
+def _derive_sensor_values(data: dict[str, Any]) -> dict[str, Any]:
+    """Precompute display values once so every entity reads a cached field."""
+    return {
+        key: transform(data[key]) if data.get(key) is not None else None
+        for key, transform in _KEY_TRANSFORMERS.items()
+    }
+
 
 class HusqvarnaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching data."""
 
+    # The DataUpdateCoordinator base keeps a __dict__, so this speeds up
+    # access to our own attributes rather than removing the dict entirely.
+    __slots__ = (
+        "address",
+        "manufacturer",
+        "model",
+        "mower",
+        "channel_id",
+        "serial",
+        "device_info",
+        "mower_id",
+        "_last_successful_update",
+        "_consecutive_failures",
+        "_cached_device",
+        "_cached_device_ts",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -51,8 +194,19 @@ class HusqvarnaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.mower = mower
         self.channel_id = channel_id
         self.serial = serial
-        self._last_successful_update: datetime | None = None
-        self._command_in_progress = False
+        # Shared by every entity so platforms don't re-normalize the MAC
+        self.mower_id = "automower_" + format_mac(address)
+        # Shared by every entity; DeviceInfo is read-only to HA
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, serial)},
+            manufacturer=manufacturer,
+            model=model,
+        )
+        # Monotonic timestamp; entities compare against it in available
+        self._last_successful_update: float | None = None
+        self._consecutive_failures = 0
+        self._cached_device: BLEDevice | None = None
+        self._cached_device_ts = 0.0
 
     async def async_shutdown(self) -> None:
         """Shutdown coordinator and any connection."""
@@ -61,13 +215,25 @@ class HusqvarnaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if self.mower.is_connected():
             await self.mower.disconnect()
 
-    async def _async_find_device(self) -> None:
-        """Attempt to reconnect to the device."""
-        _LOGGER.debug("Attempting to reconnect to the device")
+    async def _resolve_device(self) -> BLEDevice | None:
+        """Resolve the BLEDevice, reusing a recently seen device."""
+        now = monotonic()
+        if self._cached_device and now - self._cached_device_ts < DEVICE_CACHE_TTL:
+            return self._cached_device
 
         device = bluetooth.async_ble_device_from_address(
             self.hass, self.address, connectable=True
         ) or await get_device(self.address)
+        if device:
+            self._cached_device = device
+            self._cached_device_ts = now
+        return device
+
+    async def _async_find_device(self) -> None:
+        """Attempt to reconnect to the device."""
+        _LOGGER.debug("Attempting to reconnect to the device")
+
+        device = await self._resolve_device()
         if not device:
             _LOGGER.error("Failed to find device with address: %s", self.address)
             raise UpdateFailed("Can't find device")
@@ -80,29 +246,36 @@ class HusqvarnaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.error("Error during connection attempt: %s", ex)
             raise UpdateFailed("Failed to connect") from ex
 
-    async def execute_command_with_refresh(self, command_func):
-        """Execute a mower command and refresh data while maintaining connection."""
-        _LOGGER.debug("Starting command execution with refresh")
-        self._command_in_progress = True
-        try:
-            # Ensure we're connected before executing the command
-            if not self.mower.is_connected():
-                _LOGGER.debug("Mower not connected, connecting for command execution")
-                await self._async_find_device()
-
-            # Execute the command
-            _LOGGER.debug("Executing command function")
-            await command_func()
-
-            # Wait for command to be processed by the mower
-            _LOGGER.debug("Waiting for mower to process command")
-            await asyncio.sleep(3)
+    async def _wait_for_state_change(
+        self, prev_state: Any, timeout: float = 2.0, interval: float = 0.2
+    ) -> None:
+        """Poll the mower until its state differs from prev_state or timeout elapses."""
+        deadline = monotonic() + timeout
+        while True:
+            # Lock per read, not for the whole loop, so other mowers'
+            # commands aren't starved while this one settles.
+            async with BLE_RADIO_LOCK:
+                state = await self.mower.mower_state()
+            if state != prev_state:
+                return
+            if monotonic() >= deadline:
+                return
+            await asyncio.sleep(interval)
 
-            # Force a data refresh while maintaining connection
-            _LOGGER.debug("Requesting data refresh")
-            await self.async_request_refresh()
-            _LOGGER.debug("Data refresh completed")
+    async def execute_command(self, command_func):
+        """Execute a mower command, connecting first if needed."""
+        _LOGGER.debug("Starting command execution")
+        try:
+            async with BLE_RADIO_LOCK:
+                # Ensure we're connected before executing the command
+                if not self.mower.is_connected():
+                    _LOGGER.debug(
+                        "Mower not connected, connecting for command execution"
+                    )
+                    await self._async_find_device()
 
+                _LOGGER.debug("Executing command function")
+                await command_func()
         except Exception as ex:
             _LOGGER.error("Error during command execution: %s", ex)
             # Disconnect on error to ensure clean state
@@ -110,9 +283,28 @@ class HusqvarnaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 await self.mower.disconnect()
             raise
         finally:
-            self._command_in_progress = False
             _LOGGER.debug("Command execution finished")
 
+    async def async_refresh_after_command(self, prev_state: Any) -> None:
+        """Wait for the mower to process a command, then refresh data.
+
+        Runs as a background task so service calls return as soon as the
+        command itself is acknowledged.
+        """
+        # The state usually flips after a single round-trip, so this returns
+        # far sooner than a fixed sleep
+        _LOGGER.debug("Waiting for mower to process command")
+        try:
+            await self._wait_for_state_change(prev_state)
+        except (TimeoutError, BleakError) as ex:
+            # A dropped link right after a command is routine; the refresh
+            # below reconnects and reconciles the real state.
+            _LOGGER.debug("State poll after command failed: %s", ex)
+
+        _LOGGER.debug("Requesting data refresh")
+        await self.async_request_refresh()
+        _LOGGER.debug("Data refresh completed")
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Poll the device for updated data."""
         _LOGGER.debug("Polling device for data")
@@ -120,37 +312,60 @@ class HusqvarnaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         data: dict[str, Any] = {}
 
         try:
-            if not self.mower.is_connected():
-                await self._async_find_device()
+            # One mower's full sweep at a time; interleaving two mowers'
+            # polls on one radio costs more than running them back to back.
+            async with BLE_RADIO_LOCK:
+                if not self.mower.is_connected():
+                    await self._async_find_device()
 
-            # Fetch data from the mower
-            data["battery_level"] = await self.mower.battery_level()
-            data["is_charging"] = await self.mower.is_charging()
-            data["mode"] = await self.mower.mower_mode()
-            data["state"] = await self.mower.mower_state()
-            data["activity"] = await self.mower.mower_activity()
-            data["error"] = await self.mower.mower_error()
-            data["next_start_time"] = await self.mower.mower_next_start_time()
+                # Fetch sequentially: the library drives its request/response
+                # flow one exchange at a time, and sequential awaits ensure no
+                # read can outlive the lock if an earlier one fails.
+                data["battery_level"] = await self.mower.battery_level()
+                data["is_charging"] = await self.mower.is_charging()
+                data["mode"] = await self.mower.mower_mode()
+                data["state"] = await self.mower.mower_state()
+                data["activity"] = await self.mower.mower_activity()
+                data["error"] = await self.mower.mower_error()
+                data["next_start_time"] = await self.mower.mower_next_start_time()
+                data["statistics"] = await self.mower.mower_statistics()
 
-            # Fetch mower statistics
-            stats = await self.mower.mower_statistics()
-            data["statistics"] = stats
+            # Derive the HA activity and sensor display values once so every
+            # entity update is a plain dict lookup
+            data["derived_activity"] = _derive_activity(
+                data["state"], data["activity"]
+            )
+            data["derived_values"] = _derive_sensor_values(data)
 
-            self._last_successful_update = datetime.now()
+            self._last_successful_update = monotonic()
 
             _LOGGER.debug("Successfully polled data: %s", data)
 
         except (TimeoutError, BleakError) as ex:
             _LOGGER.error("Error fetching data from device: %s", ex)
+            await self._async_handle_update_failure()
             self.async_update_listeners()
             raise UpdateFailed("Error fetching data from device") from ex
         except Exception as ex:
             _LOGGER.exception("Unexpected error while fetching data: %s", ex)
+            await self._async_handle_update_failure()
             self.async_update_listeners()
             raise UpdateFailed("Unexpected error fetching data") from ex
-        finally:
-            # Only disconnect if no command is in progress
-            if not self._command_in_progress and self.mower.is_connected():
-                await self.mower.disconnect()
 
+        # Leave the connection open so the next poll skips the full
+        # connect + service-discovery cycle.
+        self._consecutive_failures = 0
         return data
+
+    async def _async_handle_update_failure(self) -> None:
+        """Track consecutive poll failures and reset the connection if they persist."""
+        self._consecutive_failures += 1
+        if (
+            self._consecutive_failures >= MAX_CONSECUTIVE_FAILURES
+            and self.mower.is_connected()
+        ):
+            _LOGGER.debug(
+                "Disconnecting after %d consecutive failed polls",
+                self._consecutive_failures,
+            )
+            await self.mower.disconnect()
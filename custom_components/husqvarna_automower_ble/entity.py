@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from time import monotonic
 from typing import Any
 
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import HusqvarnaCoordinator
 
+# Mark entities unavailable once the last successful poll is older than this
+STALE_SECONDS = 12 * 60
+
 
 class HusqvarnaAutomowerBleEntity(CoordinatorEntity):
     """Coordinator entity for Husqvarna Automower Bluetooth."""
@@ -16,12 +19,17 @@ class HusqvarnaAutomowerBleEntity(CoordinatorEntity):
     def __init__(self, coordinator: HusqvarnaCoordinator, context: Any = None) -> None:
         """Initialize coordinator entity."""
         super().__init__(coordinator, context)
+        self._attr_available = False
+
+    def _compute_available(self) -> bool:
+        """Return whether the last successful poll is recent enough."""
+        last_update = self.coordinator._last_successful_update
+        return last_update is not None and monotonic() - last_update < STALE_SECONDS
 
     @property
     def available(self) -> bool:
-        """Return if entity is available."""
-        if self.coordinator._last_successful_update is None:
-            return False
-        return datetime.now() - self.coordinator._last_successful_update < timedelta(
-            minutes=12
-        )
+        """Return if entity is available.
+
+        Recomputed in the update handlers; reads return the cached bool.
+        """
+        return self._attr_available
@@ -4,11 +4,6 @@ from __future__ import annotations
 
 import logging
 
-from bleak_retry_connector import get_device
-from husqvarna_automower_ble.protocol import MowerActivity, MowerState
-from husqvarna_automower_ble.protocol import ResponseResult
-
-from homeassistant.components import bluetooth
 from homeassistant.components.lawn_mower import (
     LawnMowerActivity,
     LawnMowerEntity,
@@ -16,7 +11,6 @@ from homeassistant.components.lawn_mower import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers import config_validation as cv, entity_platform
 
@@ -32,6 +26,9 @@ FEATURES = (
     | LawnMowerEntityFeature.DOCK
 )
 
+# Entity services are platform-wide; only register them for the first entry
+_SERVICES_REGISTERED = False
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -49,87 +46,64 @@ async def async_setup_entry(
                 coordinator,
                 f"automower_{model}_{address}",
                 model,
-                FEATURES,
             ),
         ]
     )
 
-    platform = entity_platform.async_get_current_platform()
-    platform.async_register_entity_service(
-        "park_indefinitely",
-        {},
-        "async_park_indefinitely",
-    )
-    platform.async_register_entity_service(
-        "resume_schedule",
-        {},
-        "async_resume_schedule",
-    )
+    global _SERVICES_REGISTERED
+    if not _SERVICES_REGISTERED:
+        platform = entity_platform.async_get_current_platform()
+        platform.async_register_entity_service(
+            "park_indefinitely",
+            {},
+            "async_park_indefinitely",
+        )
+        platform.async_register_entity_service(
+            "resume_schedule",
+            {},
+            "async_resume_schedule",
+        )
+        _SERVICES_REGISTERED = True
 
 
 class AutomowerLawnMower(HusqvarnaAutomowerBleEntity, LawnMowerEntity):
     """Husqvarna Automower."""
 
+    # Every mower exposes the same feature set; a class attribute avoids
+    # storing it per instance
+    _attr_supported_features = FEATURES
+
     def __init__(
         self,
         coordinator: HusqvarnaCoordinator,
         unique_id: str,
         name: str,
-        features: LawnMowerEntityFeature = LawnMowerEntityFeature(0),
     ) -> None:
         """Initialize the lawn mower."""
         super().__init__(coordinator)
         self._attr_name = name
         self._attr_unique_id = unique_id
-        self._attr_supported_features = features
         self._attr_activity = None
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.serial)},
-            manufacturer=coordinator.manufacturer,
-            model=coordinator.model,
-        )
+        self._attr_device_info = coordinator.device_info
 
     def _get_activity(self) -> LawnMowerActivity | None:
         """Return the current lawn mower activity."""
-        if not self.coordinator.data:
-            _LOGGER.warning("Coordinator data is unavailable")
+        data = self.coordinator.data
+        if not data:
+            # Normal while the first refresh overlaps entity setup
+            _LOGGER.debug("Coordinator data not yet available")
             return None
 
-        state = self.coordinator.data.get("state")
-        activity = self.coordinator.data.get("activity")
-
-        _LOGGER.debug(f"Mower state: {state}, Mower activity: {activity}")
-
-        if state is None or activity is None:
-            return None
-
-        if state == MowerState.PAUSED:
-            return LawnMowerActivity.PAUSED
-        if state in (MowerState.STOPPED, MowerState.OFF, MowerState.WAIT_FOR_SAFETYPIN):
-            # This is actually stopped, but that isn't an option
-            return LawnMowerActivity.ERROR
-        if state in (
-            MowerState.RESTRICTED,
-            MowerState.IN_OPERATION,
-            MowerState.PENDING_START,
-        ):
-            if activity in (
-                MowerActivity.CHARGING,
-                MowerActivity.PARKED,
-                MowerActivity.NONE,
-            ):
-                return LawnMowerActivity.DOCKED
-            if activity in (MowerActivity.GOING_OUT, MowerActivity.MOWING):
-                return LawnMowerActivity.MOWING
-            if activity == MowerActivity.GOING_HOME:
-                return LawnMowerActivity.RETURNING
-        return LawnMowerActivity.ERROR
+        # Derived once per poll in the coordinator
+        return data.get("derived_activity")
 
     async def async_added_to_hass(self) -> None:
         """Handle when the entity is added to Home Assistant."""
         _LOGGER.debug("AutomowerLawnMower entity added to Home Assistant")
         self._attr_activity = self._get_activity()
-        self._attr_available = self._attr_activity is not None and self.available
+        self._attr_available = (
+            self._attr_activity is not None and self._compute_available()
+        )
         await super().async_added_to_hass()
 
     @callback
@@ -137,27 +111,44 @@ class AutomowerLawnMower(HusqvarnaAutomowerBleEntity, LawnMowerEntity):
         """Handle updated data from the coordinator."""
         _LOGGER.debug("Handling coordinator update for AutomowerLawnMower")
         self._attr_activity = self._get_activity()
-        self._attr_available = self._attr_activity is not None and self.available
+        self._attr_available = (
+            self._attr_activity is not None and self._compute_available()
+        )
         super()._handle_coordinator_update()
 
+    async def _run_command(
+        self, command, optimistic_activity: LawnMowerActivity | None = None
+    ) -> None:
+        """Run a mower command and update the state optimistically.
+
+        The data refresh reconciling the real state runs in a background
+        task, so the service call returns as soon as the command is
+        acknowledged instead of waiting out a full BLE poll.
+        """
+        _LOGGER.debug("Running command - current activity: %s", self._attr_activity)
+        prev_state = (self.coordinator.data or {}).get("state")
+        await self.coordinator.execute_command(command)
+
+        if optimistic_activity is not None:
+            self._attr_activity = optimistic_activity
+            self.async_write_ha_state()
+
+        self.hass.async_create_background_task(
+            self.coordinator.async_refresh_after_command(prev_state),
+            "husqvarna_automower_ble refresh after command",
+        )
+
     async def async_dock(self) -> None:
         """Start docking."""
-        _LOGGER.debug("Docking mower - current activity: %s", self._attr_activity)
 
         async def command():
             _LOGGER.debug("Sending park command to mower")
             await self.coordinator.mower.mower_park()
 
-        await self.coordinator.execute_command_with_refresh(command)
-
-        # Update the state after refresh
-        self._attr_activity = self._get_activity()
-        _LOGGER.debug("Updated activity after dock command: %s", self._attr_activity)
-        self.async_write_ha_state()
+        await self._run_command(command, LawnMowerActivity.RETURNING)
 
     async def async_start_mowing(self) -> None:
         """Start mowing."""
-        _LOGGER.debug("Starting mower - current activity: %s", self._attr_activity)
 
         async def command():
             _LOGGER.debug("Sending resume/override commands to mower")
@@ -165,75 +156,32 @@ class AutomowerLawnMower(HusqvarnaAutomowerBleEntity, LawnMowerEntity):
             if self._attr_activity == LawnMowerActivity.DOCKED:
                 await self.coordinator.mower.mower_override()
 
-        await self.coordinator.execute_command_with_refresh(command)
-        self._attr_activity = self._get_activity()
-        _LOGGER.debug(
-            "Updated activity after start mowing command: %s", self._attr_activity
-        )
-        self.async_write_ha_state()
+        await self._run_command(command, LawnMowerActivity.MOWING)
 
     async def async_pause(self) -> None:
         """Pause mower."""
-        _LOGGER.debug("Pausing mower - current activity: %s", self._attr_activity)
 
         async def command():
             _LOGGER.debug("Sending pause command to mower")
             await self.coordinator.mower.mower_pause()
 
-        await self.coordinator.execute_command_with_refresh(command)
-        self._attr_activity = self._get_activity()
-        _LOGGER.debug("Updated activity after pause command: %s", self._attr_activity)
-        self.async_write_ha_state()
+        await self._run_command(command, LawnMowerActivity.PAUSED)
 
     async def async_park_indefinitely(self) -> None:
         """Park mower indefinitely."""
-        _LOGGER.debug(
-            "Parking mower indefinitely - current activity: %s", self._attr_activity
-        )
 
         async def command():
             _LOGGER.debug("Sending park indefinitely command to mower")
             await self.coordinator.mower.mower_park_indefinitely()
 
-        await self.coordinator.execute_command_with_refresh(command)
-        self._attr_activity = self._get_activity()
-        _LOGGER.debug(
-            "Updated activity after park indefinitely command: %s", self._attr_activity
-        )
-        self.async_write_ha_state()
+        await self._run_command(command, LawnMowerActivity.RETURNING)
 
     async def async_resume_schedule(self) -> None:
         """Resume mower schedule."""
-        _LOGGER.debug(
-            "Resuming mower schedule - current activity: %s", self._attr_activity
-        )
 
         async def command():
             _LOGGER.debug("Sending auto command to mower")
             await self.coordinator.mower.mower_auto()
 
-        await self.coordinator.execute_command_with_refresh(command)
-        self._attr_activity = self._get_activity()
-        _LOGGER.debug(
-            "Updated activity after resume schedule command: %s", self._attr_activity
-        )
-        self.async_write_ha_state()
-
-    async def _ensure_connected(self) -> bool:
-        """Ensure the mower is connected."""
-        if self.coordinator.mower.is_connected():
-            return True
-
-        _LOGGER.debug("Attempting to connect to mower")
-        device = bluetooth.async_ble_device_from_address(
-            self.coordinator.hass, self.coordinator.address, connectable=True
-        ) or await get_device(self.coordinator.address)
-        if not device:
-            _LOGGER.error("Failed to find BLE device for mower")
-            return False
-
-        if await self.coordinator.mower.connect(device) is not ResponseResult.OK:
-            _LOGGER.error("Failed to connect to mower")
-            return False
-
-        return True
+        # No optimistic activity: the schedule decides what happens next
+        await self._run_command(command)
@@ -3,10 +3,8 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
-
-from husqvarna_automower_ble.protocol import ModeOfOperation, MowerState, MowerActivity
-from husqvarna_automower_ble.error_codes import ErrorCodes
+from datetime import datetime
+from itertools import chain
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -17,18 +15,17 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.typing import StateType
 
 from .const import DOMAIN
 from .coordinator import HusqvarnaCoordinator
+from .entity import HusqvarnaAutomowerBleEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-MOWER_SENSORS = [
+MOWER_SENSORS = (
     SensorEntityDescription(
         name="Battery Level",
         key="battery_level",
@@ -87,14 +84,14 @@ MOWER_SENSORS = [
         name="Next Start Time",
         key="next_start_time",
         native_unit_of_measurement=None,
-        device_class=None,
+        device_class=SensorDeviceClass.TIMESTAMP,
         state_class=None,
         entity_category=None,
         icon="mdi:timer",
     ),
-]
+)
 
-MOWER_STATISTICS_SENSORS = [
+MOWER_STATISTICS_SENSORS = (
     SensorEntityDescription(
         name="Total running time",
         key="totalRunningTime",
@@ -149,7 +146,14 @@ MOWER_STATISTICS_SENSORS = [
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:repeat-variant",
     ),
-]
+)
+
+
+# Keys that live in the nested 'statistics' dictionary of coordinator data
+_STAT_KEYS = frozenset(description.key for description in MOWER_STATISTICS_SENSORS)
+
+# Sentinel distinguishing "key absent" from a legitimate None value
+_MISSING = object()
 
 
 async def async_setup_entry(
@@ -160,20 +164,19 @@ async def async_setup_entry(
     """Set up AutomowerLawnMower sensor from a config entry."""
     coordinator: HusqvarnaCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     _LOGGER.debug("Creating mower sensors")
-    sensors = [
-        AutomowerSensorEntity(
-            coordinator, description, "automower_" + format_mac(coordinator.address)
-        )
-        for description in MOWER_SENSORS + MOWER_STATISTICS_SENSORS
-    ]
-    if not sensors:
-        _LOGGER.error("No sensors were created. Check MOWER_SENSORS.")
-    async_add_entities(sensors)
+    async_add_entities(
+        AutomowerSensorEntity(coordinator, description, coordinator.mower_id)
+        for description in chain(MOWER_SENSORS, MOWER_STATISTICS_SENSORS)
+    )
 
 
-class AutomowerSensorEntity(CoordinatorEntity, SensorEntity):
+class AutomowerSensorEntity(HusqvarnaAutomowerBleEntity, SensorEntity):
     """Representation of an Automower sensor."""
 
+    # Only our own fields; _attr_* names carry defaults on the Entity base
+    # and cannot be slotted without shadowing them
+    __slots__ = ("_is_stat",)
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -192,84 +195,46 @@ class AutomowerSensorEntity(CoordinatorEntity, SensorEntity):
         self._attr_state_class = description.state_class
         self._attr_entity_category = description.entity_category
         self._attr_icon = description.icon
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.serial)},
-            manufacturer=coordinator.manufacturer,
-            model=coordinator.model,
-        )
+        self._attr_device_info = coordinator.device_info
 
         self._attr_unique_id = f"{mower_id}_{description.key}"
+        self._is_stat = description.key in _STAT_KEYS
         _LOGGER.debug(
             "Creating sensor entity: %s with unique_id: %s",
             self.entity_description.name,
             self._attr_unique_id,
         )
 
-    def _get_state(self) -> str | None:
+    def _get_state(self) -> StateType | datetime:
         """Return the state of the sensor."""
-        try:
-            key = self.entity_description.key
-            # Check if this sensor is a statistics sensor
-            is_statistic_sensor = any(
-                desc.key == key for desc in MOWER_STATISTICS_SENSORS
-            )
-
-            if is_statistic_sensor:
-                # Access value from the nested 'statistics' dictionary
-                stats_data = self.coordinator.data.get("statistics", {})
-                value = stats_data[key]
-            else:
-                value = self.coordinator.data[key]
-                if key == "mode":
-                    value = ModeOfOperation(value).name
-                elif key == "state":
-                    value = MowerState(value).name
-                elif key == "activity":
-                    value = MowerActivity(value).name
-                elif key == "error":
-                    value = ErrorCodes(value).name
-                elif key == "next_start_time" and value is not None:
-                    # Ensure value is a datetime object before formatting
-                    if isinstance(value, datetime):
-                        value = value.replace(tzinfo=None).strftime("%Y-%m-%d %H:%M:%S")
-                    else:
-                        _LOGGER.warning(
-                            "Expected datetime for next_start_time, got %s", type(value)
-                        )
-                        value = None
-
-            _LOGGER.debug(
-                "Update sensor %s with value %s",
-                key,
-                value,
-            )
-            return value
-        except Exception as e:
-            _LOGGER.error(
-                "Error processing state for sensor %s: %s",
-                self.entity_description.key,
-                e,
-                exc_info=True,
-            )
+        key = self.entity_description.key
+        data = self.coordinator.data
+        if not data:
             return None
 
-    @property
-    def available(self) -> bool:
-        """Return if the sensor is available."""
-        last_update = self.coordinator._last_successful_update
-        if last_update is None:
-            return False
-        return datetime.now() - last_update < timedelta(minutes=12)
+        # dict.get keeps the common path exception-free; a missing key is an
+        # expected condition, not worth try/except frame setup on every read.
+        if self._is_stat:
+            statistics = data.get("statistics")
+            value = statistics.get(key, _MISSING) if statistics else _MISSING
+        else:
+            # Display values are derived once per poll in the coordinator
+            value = data["derived_values"].get(key, data.get(key, _MISSING))
+
+        if value is _MISSING:
+            _LOGGER.error("No data for sensor %s", key)
+            return None
+        return value
 
     async def async_added_to_hass(self) -> None:
         """Handle when the entity is added to Home Assistant."""
         self._attr_native_value = self._get_state()
-        self._attr_available = self.available
+        self._attr_available = self._compute_available()
         await super().async_added_to_hass()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle coordinator update."""
         self._attr_native_value = self._get_state()
-        self._attr_available = self.available
+        self._attr_available = self._compute_available()
         super()._handle_coordinator_update()